@@ -9,16 +9,22 @@ automatically generate repo traffic report (totals, averages, best day)
 from __future__ import annotations
 
 import argparse
+import asyncio
+import atexit
 import csv
+import io
+import itertools
+import json
+import multiprocessing
 import os
 import sys
 import sqlite3
 import threading
-from collections import defaultdict
-from datetime import datetime, timedelta
+import time
+from datetime import date, datetime, timedelta, timezone
 from typing import Dict, List
 
-import requests
+import httpx
 from flask import Flask
 from rich.console import Console
 from rich.progress import (
@@ -28,6 +34,14 @@ from rich.progress import (
     TimeElapsedColumn,
 )
 from rich.table import Table
+from waitress import serve
+
+try:  # optional: 2-5× faster decoding of API responses
+    import orjson
+
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
 
 # ── CLI flags ────────────────────────────────────────────────────────────────
 parser = argparse.ArgumentParser(prog="orv", add_help=False)
@@ -38,24 +52,63 @@ args, _ = parser.parse_known_args()
 
 # ── Config ───────────────────────────────────────────────────────────────────
 TOKEN = os.getenv("ORV_TOKEN") or os.getenv("GITHUB_TOKEN")
-if not TOKEN:
-    sys.exit("‼️  ORV_TOKEN / GITHUB_TOKEN missing.")
+# optional pool, comma-separated. The 5000 req/hr limit is per account, so only
+# tokens of other accounts with push access to OWNER's repos add headroom
+TOKENS = [t.strip() for t in os.getenv("ORV_TOKENS", "").split(",") if t.strip()]
+if TOKEN and TOKEN not in TOKENS:
+    TOKENS.insert(0, TOKEN)
+if not TOKENS:
+    sys.exit("‼️  ORV_TOKEN / ORV_TOKENS / GITHUB_TOKEN missing.")
 
 API = "https://api.github.com"
-HEADERS = {"Authorization": f"Bearer {TOKEN}",
-           "Accept": "application/vnd.github+json"}
+HEADERS = {"Accept": "application/vnd.github+json"}  # auth is per request
 LOOKBACK = 14  # days
+CONCURRENCY = 16  # in-flight traffic requests (friendly to secondary limits)
+MAX_ATTEMPTS = 5  # per request, when rate-limited or 5xx
+IDLE_RECHECK = 7 * 86400  # re-poll repos that had no traffic after this long
+REPO_TTL = 15 * 60  # reuse the repo listing across menu runs for this long
+BUCKET_SIZE = 900  # REST secondary limit: 900 points/min (1 per GET)
+BUCKET_RATE = BUCKET_SIZE / 60  # refill, per second
 DB_PATH = "traffic.db"
 CSV_PATH = "github_traffic.csv"
+DOW = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
 console = Console()
 
+# HTTP/2: one TLS connection multiplexes every in-flight request as a stream
+LIMITS = httpx.Limits(max_connections=32, max_keepalive_connections=32)
+TIMEOUT = 10.0  # seconds
+CLIENT = httpx.Client(http2=True, headers=HEADERS, limits=LIMITS, timeout=TIMEOUT,
+                      follow_redirects=True)  # renamed repos answer 301
+
+# ── Token pool ───────────────────────────────────────────────────────────────
+REMAINING = {t: 5000 for t in TOKENS}  # last X-RateLimit-Remaining per token
+_ROTATION = itertools.cycle(range(len(TOKENS)))
+
+
+def _pick_token() -> str:
+    """Token with the most quota left; the rotation spreads ties round-robin."""
+    i = next(_ROTATION)
+    return max(TOKENS[i:] + TOKENS[:i], key=REMAINING.__getitem__)
+
+
+def _auth(token: str) -> Dict[str, str]:
+    return {"Authorization": f"Bearer {token}"}
+
+
+def _note_quota(token: str, headers) -> None:
+    if headers.get("X-RateLimit-Resource", "core") != "core":
+        return  # GraphQL has its own budget; the pool balances REST quota
+    if "X-RateLimit-Remaining" in headers:
+        REMAINING[token] = int(headers["X-RateLimit-Remaining"])
+
+
 # ── Auth check ───────────────────────────────────────────────────────────────
 
 
 def who_am_i() -> str:
-    r = requests.get(f"{API}/user", headers=HEADERS)
+    r = CLIENT.get(f"{API}/user", headers=_auth(TOKENS[0]))
     r.raise_for_status()
-    login = r.json()["login"]
+    login = _loads(r.content)["login"]
     scopes = r.headers.get("X-OAuth-Scopes")
     console.print(f"👤 [bold]{login}[/] authenticated.")
     if scopes:
@@ -72,48 +125,257 @@ OWNER = who_am_i()
 # ── Helper that surfaces missing permissions ────────────────────────────────
 
 
-def _get(url: str, **kw):
-    r = requests.get(url, headers=HEADERS, **kw)
+def _forbidden(url: str, headers, blob) -> None:
+    perms = headers.get("X-Accepted-GitHub-Permissions")
+    msg = blob.get("message", "Forbidden")
+    console.print(f"🚫 403 {url} – {msg}")
+    if perms:
+        console.print(
+            f"   needs → {perms}\n   enable Repository → Administration → Read (Traffic)"
+        )
+
+
+_bucket = {"tokens": float(BUCKET_SIZE), "at": time.monotonic()}
+_bucket_lock = threading.Lock()
+
+
+def _take() -> float:
+    """Reserve one request from the token bucket; returns seconds to wait first."""
+    with _bucket_lock:
+        now = time.monotonic()
+        _bucket["tokens"] = min(
+            BUCKET_SIZE, _bucket["tokens"] + (now - _bucket["at"]) * BUCKET_RATE
+        )
+        _bucket["at"] = now
+        _bucket["tokens"] -= 1
+        return max(0.0, -_bucket["tokens"] / BUCKET_RATE)
+
+
+def _reset_wait(headers) -> float:
+    """Seconds until the primary rate-limit window resets."""
+    return max(0.0, int(headers.get("X-RateLimit-Reset", 0)) - time.time()) + 1
+
+
+def _backoff(status: int, headers, attempt: int,
+             pinned: bool = False) -> float | None:
+    """Seconds to sleep before retrying, or None if the response is final."""
+    if status in (403, 429):
+        if headers.get("Retry-After"):  # secondary limit
+            return float(headers["Retry-After"])
+        if headers.get("X-RateLimit-Remaining") == "0":  # primary limit
+            # switch to another pooled token if one still has quota
+            if not pinned and any(REMAINING.values()):
+                return 0.0
+            return _reset_wait(headers)
+    if status in (429, 502, 503, 504):
+        return float(min(30, 2**attempt))
+    return None  # plain 403 = missing permission
+
+
+def _throttle(status: int, headers, attempt: int,
+              pinned: bool = False) -> float | None:
+    wait = _backoff(status, headers, attempt, pinned)
+    if wait is None or attempt == MAX_ATTEMPTS - 1:
+        return None
+    reason = "rate-limited" if status in (403, 429) else "server error"
+    console.print(f"⏳ {reason} ({status}), retrying in {wait:.0f}s")
+    return wait
+
+
+def _transport_wait(exc: httpx.TransportError, attempt: int) -> float:
+    """Connect/read failures back off like a 5xx; the last attempt re-raises."""
+    if attempt == MAX_ATTEMPTS - 1:
+        raise exc
+    wait = float(min(30, 2**attempt))
+    console.print(f"⏳ {type(exc).__name__}, retrying in {wait:.0f}s")
+    return wait
+
+
+def _request(method: str, url: str, etag: str | None = None,
+             token: str | None = None, **kw) -> httpx.Response:
+    """One API call paced by the bucket and retried on limits, 5xx and
+    transport errors. `token` pins the call; otherwise the pool picks.
+    """
+    for attempt in range(MAX_ATTEMPTS):
+        time.sleep(_take())
+        tok = token or _pick_token()
+        headers = _auth(tok)
+        if etag:
+            headers["If-None-Match"] = etag  # 304s are free of quota
+        try:
+            r = CLIENT.request(method, url, headers=headers, **kw)
+        except httpx.TransportError as exc:
+            time.sleep(_transport_wait(exc, attempt))
+            continue
+        _note_quota(tok, r.headers)
+        wait = _throttle(r.status_code, r.headers, attempt, token is not None)
+        if wait is None:
+            break
+        time.sleep(wait)
+    return r
+
+
+async def _arequest(client: httpx.AsyncClient, method: str, url: str,
+                    etag: str | None = None, token: str | None = None,
+                    **kw) -> httpx.Response:
+    """`_request` for the async fan-out."""
+    for attempt in range(MAX_ATTEMPTS):
+        await asyncio.sleep(_take())
+        tok = token or _pick_token()
+        headers = _auth(tok)
+        if etag:
+            headers["If-None-Match"] = etag
+        try:
+            r = await client.request(method, url, headers=headers, **kw)
+        except httpx.TransportError as exc:
+            await asyncio.sleep(_transport_wait(exc, attempt))
+            continue
+        _note_quota(tok, r.headers)
+        wait = _throttle(r.status_code, r.headers, attempt, token is not None)
+        if wait is None:
+            break
+        await asyncio.sleep(wait)
+    return r
+
+
+def _get(url: str, conn: sqlite3.Connection | None = None,
+         fresh: Dict[str, tuple] | None = None, **kw):
+    """GET → decoded JSON payload, or None on 403/404.
+
+    With `conn`, the request is conditional on the ETag cached in its
+    `etags` table and a 304 replays the stored body. A new ETag is stored
+    there and also recorded in `fresh`, so callers can tell it changed.
+    """
+    cached = (
+        conn.execute("SELECT etag, body FROM etags WHERE url = ?", (url,)).fetchone()
+        if conn is not None
+        else None
+    )
+    r = _request("GET", url, cached[0] if cached else None, **kw)
+    if r.status_code == 304:
+        return _loads(cached[1])
     if r.status_code == 403:
-        perms = r.headers.get("X-Accepted-GitHub-Permissions")
-        msg = r.json().get("message", "Forbidden")
-        console.print(f"🚫 403 {url} – {msg}")
-        if perms:
-            console.print(
-                f"   needs → {perms}\n   enable Repository → Administration → Read (Traffic)"
-            )
+        _forbidden(url, r.headers, _loads(r.content))
         return None
     if r.status_code == 404:
         return None
     r.raise_for_status()
-    return r
+    if not any(REMAINING.values()):
+        time.sleep(_reset_wait(r.headers))  # next call would just burn a 403
+    if conn is not None and r.headers.get("ETag"):
+        save_etags(conn, {url: (r.headers["ETag"], r.content)})
+        if fresh is not None:
+            fresh[url] = (r.headers["ETag"], r.content)
+    return _loads(r.content)
 
 
 # ── API helpers ──────────────────────────────────────────────────────────────
-def list_repos() -> List[str]:
-    url = f"{API}/user/repos?affiliation=owner&per_page=100"
-    out: List[str] = []
-    while url:
-        r = _get(url)
-        if r is None:
+REPOS_QUERY = """
+query($after: String) {
+  viewer {
+    repositories(first: 100, after: $after, ownerAffiliations: OWNER, isFork: false) {
+      pageInfo { hasNextPage endCursor }
+      nodes { name pushedAt }
+    }
+  }
+}"""
+
+
+def open_client() -> httpx.AsyncClient:
+    """One HTTP/2 client for discovery and the traffic fan-out."""
+    return httpx.AsyncClient(http2=True, headers=HEADERS, limits=LIMITS,
+                             timeout=TIMEOUT, follow_redirects=True)
+
+
+_repo_cache: dict = {"at": 0.0, "repos": None}
+
+
+async def list_repos(client: httpx.AsyncClient) -> Dict[str, float]:
+    """Owned, non-fork repos → last push (epoch) via GraphQL, 100 per call.
+
+    A complete listing is memoized for REPO_TTL seconds.
+    """
+    if (_repo_cache["repos"] is not None
+            and time.monotonic() - _repo_cache["at"] < REPO_TTL):
+        return _repo_cache["repos"]
+    out: Dict[str, float] = {}
+    after = None
+    while True:
+        query = {"query": REPOS_QUERY, "variables": {"after": after}}
+        # `viewer` is the token's own account: stay on the one who_am_i() checked
+        try:
+            r = await _arequest(client, "POST", f"{API}/graphql",
+                                token=TOKENS[0], json=query)
+            r.raise_for_status()
+        except httpx.HTTPError as exc:
+            console.print(f"🚫 graphql – {exc}")
+            return out  # partial: not cached
+        blob = _loads(r.content)
+        if blob.get("errors"):
+            console.print(f"🚫 graphql – {blob['errors'][0].get('message')}")
+            return out  # partial: not cached
+        page = blob["data"]["viewer"]["repositories"]
+        for node in page["nodes"]:
+            pushed = node["pushedAt"]  # null for never-pushed repos
+            out[node["name"]] = (
+                datetime.fromisoformat(pushed.replace("Z", "+00:00")).timestamp()
+                if pushed else 0.0
+            )
+        if not page["pageInfo"]["hasNextPage"]:
             break
-        out += [repo["name"] for repo in r.json() if not repo.get("fork")]
-        url = r.links.get("next", {}).get("url")
+        after = page["pageInfo"]["endCursor"]
+    _repo_cache.update(at=time.monotonic(), repos=out)
     return out
 
 
-def fetch_traffic(kind: str, repo: str):
-    r = _get(f"{API}/repos/{OWNER}/{repo}/traffic/{kind}",
-             params={"per": "day"})
-    if r is None:
-        return []
-    blob = r.json()
+async def fetch_traffic(client: httpx.AsyncClient, kind: str, repo: str,
+                        etags: Dict[str, tuple], fresh: Dict[str, tuple]):
+    url = f"{API}/repos/{OWNER}/{repo}/traffic/{kind}"
+    cached = etags.get(url)
+    r = await _arequest(client, "GET", url, cached[0] if cached else None,
+                        params={"per": "day"})
+    if r.status_code == 304:
+        blob = _loads(cached[1])
+    elif r.status_code == 403:
+        _forbidden(url, r.headers, _loads(r.content))
+        return None
+    elif r.status_code == 404:
+        return None
+    else:
+        r.raise_for_status()
+        blob = _loads(r.content)
+        if r.headers.get("ETag"):
+            fresh[url] = (r.headers["ETag"], r.content)
+    if not any(REMAINING.values()):
+        await asyncio.sleep(_reset_wait(r.headers))
     return blob.get(kind) or blob.get("views") or blob.get("clones") or []
 
 
+async def fetch_all_traffic(client: httpx.AsyncClient, repos: List[str],
+                            on_done, etags: Dict[str, tuple],
+                            fresh: Dict[str, tuple]) -> List[tuple]:
+    """Fan out views+clones for every repo; returns [(kind, repo, entries), …].
+
+    `etags` holds cached (etag, body) per URL; new 200 bodies land in `fresh`.
+    """
+    sem = asyncio.Semaphore(CONCURRENCY)
+
+    async def one(kind: str, repo: str):
+        async with sem:
+            entries = await fetch_traffic(client, kind, repo, etags, fresh)
+        on_done(kind, repo)
+        return kind, repo, entries
+
+    return await asyncio.gather(
+        *(one(kind, repo) for repo in repos for kind in ("views", "clones"))
+    )
+
+
 # ── DB + CSV helpers ─────────────────────────────────────────────────────────
 def init_db() -> sqlite3.Connection:
     conn = sqlite3.connect(DB_PATH)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
     conn.execute(
         """CREATE TABLE IF NOT EXISTS traffic(
             date TEXT PRIMARY KEY,
@@ -121,39 +383,133 @@ def init_db() -> sqlite3.Connection:
             clones INT, unique_clones INT
         )"""
     )
+    conn.execute(
+        """CREATE TABLE IF NOT EXISTS etags(
+            url TEXT PRIMARY KEY,
+            etag TEXT, body BLOB,
+            fetched_at INTEGER
+        )"""
+    )
+    conn.execute(
+        """CREATE TABLE IF NOT EXISTS empty_repos(
+            name TEXT PRIMARY KEY,
+            last_checked INTEGER
+        )"""
+    )
     return conn
 
 
-def upsert(conn: sqlite3.Connection, day: str, s: Dict[str, int]):
-    conn.execute(
-        """INSERT INTO traffic VALUES (?,?,?,?,?)
-           ON CONFLICT(date) DO UPDATE SET
-             views=excluded.views, unique_views=excluded.unique_views,
-             clones=excluded.clones, unique_clones=excluded.unique_clones""",
-        (day, s["views"], s["unique_views"], s["clones"], s["unique_clones"]),
-    )
-    conn.commit()
+def load_mem(disk: sqlite3.Connection) -> sqlite3.Connection:
+    """In-memory copy of the on-disk DB (schema included)."""
+    mem = sqlite3.connect(":memory:", check_same_thread=False)
+    disk.backup(mem)
+    return mem
+
+
+def snapshot(mem: sqlite3.Connection) -> None:
+    """Persist the in-memory DB to DB_PATH in a single backup pass."""
+    mem.backup(DISK)
+
+
+def save_all(conn: sqlite3.Connection, rows: List[tuple]):
+    """Upsert one already-summed row per date; other stored days are kept.
+
+    `rows` are (date, views, unique_views, clones, unique_clones).
+    """
+    with conn:
+        conn.executemany(
+            """INSERT INTO traffic(date, views, unique_views, clones, unique_clones)
+               VALUES (?,?,?,?,?)
+               ON CONFLICT(date) DO UPDATE SET
+                 views=excluded.views,
+                 unique_views=excluded.unique_views,
+                 clones=excluded.clones,
+                 unique_clones=excluded.unique_clones""",
+            rows,
+        )
+
+
+def load_window(conn: sqlite3.Connection, cutoff: str) -> Dict[str, Dict[str, int]]:
+    return {
+        d: {"views": v, "unique_views": uv, "clones": c, "unique_clones": uc}
+        for d, v, uv, c, uc in conn.execute(
+            """SELECT date, views, unique_views, clones, unique_clones
+               FROM traffic WHERE date >= ? ORDER BY date""",
+            (cutoff,),
+        )
+    }
+
+
+def idle_repos(conn: sqlite3.Connection, pushed: Dict[str, float]) -> set:
+    """Repos empty on their last check, checked recently and not pushed since."""
+    now = time.time()
+    return {
+        name
+        for name, checked in conn.execute("SELECT name, last_checked FROM empty_repos")
+        if name in pushed and now - checked < IDLE_RECHECK and pushed[name] < checked
+    }
+
+
+def mark_idle(conn: sqlite3.Connection, polled: List[str], empty: set):
+    now = int(time.time())
+    with conn:
+        conn.executemany("DELETE FROM empty_repos WHERE name = ?",
+                         [(r,) for r in polled if r not in empty])
+        conn.executemany("INSERT OR REPLACE INTO empty_repos VALUES (?,?)",
+                         [(r, now) for r in empty])
+
+
+def load_etags(conn: sqlite3.Connection) -> Dict[str, tuple]:
+    return {url: (etag, body)
+            for url, etag, body in conn.execute("SELECT url, etag, body FROM etags")}
+
+
+def save_etags(conn: sqlite3.Connection, fresh: Dict[str, tuple]):
+    now = int(time.time())
+    with conn:
+        conn.executemany(
+            "INSERT OR REPLACE INTO etags VALUES (?,?,?,?)",
+            [(url, etag, body, now) for url, (etag, body) in fresh.items()],
+        )
 
 
 def write_csv(totals: Dict[str, Dict[str, int]]):
+    buf = io.StringIO(newline="")
+    writer = csv.writer(buf)
+    writer.writerow(
+        ["Date", "DayOfWeek", "Views", "UniqueViews", "Clones", "UniqueClones"]
+    )
+    writer.writerows(
+        (d, DOW[date.fromisoformat(d).weekday()],
+         s["views"], s["unique_views"], s["clones"], s["unique_clones"])
+        for d in sorted(totals)
+        for s in (totals[d],)
+    )
     with open(CSV_PATH, "w", newline="") as f:
-        writer = csv.writer(f)
-        writer.writerow(
-            ["Date", "DayOfWeek", "Views", "UniqueViews", "Clones", "UniqueClones"]
-        )
-        for d in sorted(totals):
-            s = totals[d]
-            dow = datetime.fromisoformat(d).strftime("%a")
-            writer.writerow(
-                [d, dow, s["views"], s["unique_views"], s["clones"], s["unique_clones"]])
+        f.write(buf.getvalue())  # the whole file in one write()
+
+
+# both live for the whole process: no reconnect or schema check per fetch
+DISK = init_db()
+atexit.register(DISK.close)  # checkpoints the WAL back into traffic.db
+MEM = load_mem(DISK)  # fetch_daily works here; snapshot() persists to DISK
 
 
 # ── Rich helpers ─────────────────────────────────────────────────────────────
 def print_report(summary: Dict[str, Dict[str, int]]) -> None:
-    total_views = sum(v["views"] for v in summary.values())
-    total_clones = sum(v["clones"] for v in summary.values())
-    best_day_v = max(summary.items(), key=lambda x: x[1]["views"])
-    best_day_c = max(summary.items(), key=lambda x: x[1]["clones"])
+    # one pass for both totals and both best days
+    total_views = total_clones = 0
+    best_day_v = best_day_c = (None, {"views": -1, "clones": -1})
+    for day, s in summary.items():
+        total_views += s["views"]
+        total_clones += s["clones"]
+        if s["views"] > best_day_v[1]["views"]:
+            best_day_v = (day, s)
+        if s["clones"] > best_day_c[1]["clones"]:
+            best_day_c = (day, s)
+    if not total_views and not total_clones:  # empty or all-zero window
+        console.print("ℹ️  No traffic in window.")
+        return
 
     table = Table(title="📊 GitHub Traffic Report", box=None)
     table.add_column("Metric", style="bold cyan")
@@ -173,51 +529,81 @@ def print_report(summary: Dict[str, Dict[str, int]]) -> None:
 
 # ── Main fetch routine ───────────────────────────────────────────────────────
 def fetch_daily():
-    cutoff = (datetime.utcnow() - timedelta(days=LOOKBACK)).date().isoformat()
-    totals: Dict[str, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
-    repos = list_repos()
-    console.print(f"⏳ Pulling {LOOKBACK}-day traffic for {len(repos)} repos…")
-
-    progress_cm = (
-        Progress(
-            SpinnerColumn(),
-            "[progress.percentage]{task.percentage:>3.0f}%",
-            BarColumn(),
-            TimeElapsedColumn(),
-            console=console,
-            transient=True,
+    asyncio.run(_fetch_daily())
+
+
+async def _fetch_daily():
+    today = datetime.now(timezone.utc).date()
+    cutoff = (today - timedelta(days=LOOKBACK)).isoformat()
+    async with open_client() as client:
+        pushed = await list_repos(client)
+        conn = MEM
+        idle = idle_repos(conn, pushed)
+        repos = [r for r in pushed if r not in idle]
+        etags, fresh = load_etags(conn), {}
+        console.print(
+            f"⏳ Pulling {LOOKBACK}-day traffic for {len(repos)} repos"
+            + (f" ({len(idle)} idle skipped)…" if idle else "…")
+        )
+
+        progress_cm = (
+            Progress(
+                SpinnerColumn(),
+                "[progress.percentage]{task.percentage:>3.0f}%",
+                BarColumn(),
+                TimeElapsedColumn(),
+                console=console,
+                transient=True,
+            )
+            if not args.verbose
+            else None
         )
-        if not args.verbose
-        else None
-    )
 
-    iterator = progress_cm.track(
-        repos, description="Fetching") if progress_cm else repos
-    if progress_cm:
-        progress_cm.start()
-
-    for repo in iterator:
-        if args.verbose:
-            console.print(f"• {repo}")
-        for kind in ("views", "clones"):
-            for e in fetch_traffic(kind, repo):
-                day = e["timestamp"][:10]
-                if day < cutoff:
-                    continue
-                t = totals[day]
-                if kind == "views":
-                    t["views"] += e["count"]
-                    t["unique_views"] += e["uniques"]
-                else:
-                    t["clones"] += e["count"]
-                    t["unique_clones"] += e["uniques"]
-
-    if progress_cm:
-        progress_cm.stop()
-
-    conn = init_db()
-    for d, stat in totals.items():
-        upsert(conn, d, stat)
+        if progress_cm:
+            task = progress_cm.add_task("Fetching", total=2 * len(repos))
+            progress_cm.start()
+
+        def on_done(kind: str, repo: str) -> None:
+            if progress_cm:
+                progress_cm.advance(task)
+            else:
+                console.print(f"• {repo} ({kind})")
+
+        results = await fetch_all_traffic(client, repos, on_done, etags, fresh)
+
+        if progress_cm:
+            progress_cm.stop()
+
+    # every day of the window up front, keyed by date (per=day stamps are
+    # midnight UTC): [views, unique_views, clones, unique_clones]. The lookup
+    # doubles as the window filter; only days GitHub reported are saved, so
+    # stored counts for unreported days are never zeroed.
+    totals = {
+        (today - timedelta(days=i)).isoformat(): [0, 0, 0, 0]
+        for i in range(LOOKBACK, -1, -1)
+    }
+    seen = set()
+    for kind, _, entries in results:
+        col = 0 if kind == "views" else 2
+        for e in entries or ():
+            day = e["timestamp"][:10]
+            t = totals.get(day)
+            if t is None:
+                continue
+            t[col] += e["count"]
+            t[col + 1] += e["uniques"]
+            seen.add(day)
+    rows = [(day, *t) for day, t in totals.items() if day in seen]
+
+    # no traffic on either endpoint (403/404 come back as None, not [])
+    empty = ({repo for _, repo, entries in results if entries == []}
+             - {repo for _, repo, entries in results if entries != []})
+
+    save_etags(conn, fresh)
+    mark_idle(conn, repos, empty)
+    save_all(conn, rows)
+    snapshot(conn)
+    totals = load_window(conn, cutoff)
 
     write_csv(totals)
     console.print(f"✅ Saved → {CSV_PATH} & {DB_PATH}")
@@ -227,39 +613,96 @@ def fetch_daily():
 # ── Dashboard (Flask) ────────────────────────────────────────────────────────
 app = Flask(__name__)
 
-
-@app.route("/")
-def dashboard():
-    rows = init_db().execute(
-        "SELECT date, views, clones FROM traffic ORDER BY date"
-    ).fetchall()
-    dates, views, clones = zip(*rows) if rows else ([], [], [])
-    return f"""
+TMPL_SRC = """
 <!doctype html><html><head><meta charset="utf-8">
-<title>{OWNER} Traffic</title><script src="https://cdn.jsdelivr.net/npm/chart.js"></script>
-<style>body{{font:16px/1.5 system-ui;margin:2rem}}</style></head><body>
-<h1>{OWNER} <small style="font-size:0.6em">last {LOOKBACK} days</small></h1>
+<title>{{ owner }} Traffic</title><script src="https://cdn.jsdelivr.net/npm/chart.js"></script>
+<style>body{font:16px/1.5 system-ui;margin:2rem}</style></head><body>
+<h1>{{ owner }} <small style="font-size:0.6em">last {{ lookback }} days</small></h1>
 <canvas id="c"></canvas>
 <script>
-new Chart(c,{{
+new Chart(c,{
   type:'line',
-  data:{{labels:{list(dates)},
-        datasets:[{{label:'Views',data:{list(views)},borderColor:'royalblue',fill:false}},
-                  {{label:'Clones',data:{list(clones)},borderColor:'seagreen',fill:false}}]}}
-}});
+  data:{labels:{{ dates|safe }},
+        datasets:[{label:'Views',data:{{ views|safe }},borderColor:'royalblue',fill:false},
+                  {label:'Clones',data:{{ clones|safe }},borderColor:'seagreen',fill:false}]}
+});
 </script></body></html>"""
+_DASH_TMPL = app.jinja_env.from_string(TMPL_SRC)  # compiled once, not per hit
+
+_dash_lock = threading.Lock()
+_dash: dict = {"html": None, "version": None}
+
+
+def dash_version() -> int:
+    """`PRAGMA data_version` of a read-only handle on the disk DB.
+
+    It bumps whenever another connection (snapshot() in the CLI process)
+    commits; unlike the file mtime it also sees writes still in the WAL.
+    Call with `_dash_lock` held.
+    """
+    if "disk" not in _dash:
+        _dash["disk"] = sqlite3.connect(
+            f"file:{DB_PATH}?mode=ro", uri=True, check_same_thread=False
+        )
+    return _dash["disk"].execute("PRAGMA data_version").fetchone()[0]
+
+
+@app.route("/")
+def dashboard():
+    with _dash_lock:
+        version = dash_version()
+        if version != _dash["version"]:  # re-query + re-render only on change
+            _dash["html"] = render_dashboard(_dash["disk"])
+            _dash["version"] = version
+        return _dash["html"]
+
+
+def render_dashboard(conn: sqlite3.Connection) -> str:
+    dates, views, clones = [], [], []
+    for d, v, c in conn.execute(
+        "SELECT date, views, clones FROM traffic ORDER BY date"
+    ):
+        dates.append(d)
+        views.append(v)
+        clones.append(c)
+    # dates are ISO strings and counts ints → plain JSON is script-safe
+    compact = {"separators": (",", ":")}
+    return _DASH_TMPL.render(
+        owner=OWNER,
+        lookback=LOOKBACK,
+        dates=json.dumps(dates, **compact),
+        views=json.dumps(views, **compact),
+        clones=json.dumps(clones, **compact),
+    )
 
 
 def launch_dashboard():
     console.print("🌐  Dashboard → http://localhost:5000")
-    app.run(host="0.0.0.0", port=5000, debug=False)
+    serve(app, host="0.0.0.0", port=5000, threads=4)
+
+
+def start_dashboard() -> None:
+    """Serve the dashboard in the background without re-importing orv.
+
+    A forked child inherits OWNER and the DB handles as they are; spawn and
+    forkserver would re-run who_am_i() and the DB setup in the child, so
+    where fork doesn't exist (Windows) the server runs on a daemon thread.
+    """
+    if "fork" in multiprocessing.get_all_start_methods():
+        ctx = multiprocessing.get_context("fork")
+        ctx.Process(target=launch_dashboard, daemon=True).start()
+    else:
+        threading.Thread(target=launch_dashboard, daemon=True).start()
 
 
 # ── Drill-downs ──────────────────────────────────────────────────────────────
 def drill(which: str):
     repo = console.input("Repo name: ").strip()
-    rows = (
-        _get(f"{API}/repos/{OWNER}/{repo}/traffic/popular/{which}") or [])[:10]
+    fresh: Dict[str, tuple] = {}
+    rows = (_get(f"{API}/repos/{OWNER}/{repo}/traffic/popular/{which}",
+                 conn=MEM, fresh=fresh) or [])[:10]
+    if fresh:
+        snapshot(MEM)  # keep the refreshed ETag across runs
     if not rows:
         console.print("ℹ️  No data.")
         return
@@ -272,6 +715,26 @@ def drill(which: str):
     console.print(tab)
 
 
+def show_rate_limit():
+    """Quota per pooled token; /rate_limit doesn't count against it."""
+    tab = Table(title="🚦 Rate limit", box=None)
+    tab.add_column("Token", justify="left")
+    tab.add_column("Resource", justify="left")
+    tab.add_column("Remaining", justify="right")
+    tab.add_column("Limit", justify="right")
+    tab.add_column("Resets", justify="right")
+    for i, token in enumerate(TOKENS, 1):
+        blob = _get(f"{API}/rate_limit", token=token)
+        if blob is None:
+            continue
+        label = f"#{i} …{token[-4:]}"
+        for name, r in blob.get("resources", {}).items():
+            reset = datetime.fromtimestamp(r["reset"]).strftime("%H:%M:%S")
+            tab.add_row(label, name, f"{r['remaining']:,}", f"{r['limit']:,}", reset)
+            label = ""
+    console.print(tab)
+
+
 # ── Menu ─────────────────────────────────────────────────────────────────────
 def menu():
     while True:
@@ -291,9 +754,10 @@ def menu():
         elif choice == "3":
             drill("paths")
         elif choice == "4":
-            threading.Thread(target=launch_dashboard, daemon=True).start()
+            # own process → own GIL, so a running fetch can't stall the server
+            start_dashboard()
         elif choice == "5":
-            _get(f"{API}/rate_limit")
+            show_rate_limit()
         elif choice == "6":
             break
         else: